@@ -97,11 +97,7 @@ PALETTE_SLOTS = [
 
 
 def _hex_from_rgb(r, g, b):
-    return "#{:02X}{:02X}{:02X}".format(
-        max(0, min(255, int(r * 255))),
-        max(0, min(255, int(g * 255))),
-        max(0, min(255, int(b * 255))),
-    )
+    return color_math.rgb_to_hex((r, g, b))
 
 
 def _rgb_from_hex(hexstr):
@@ -177,7 +173,7 @@ def _populate_palette_from_iterm(wm, iterm_theme):
     """Fill the editable palette collection from a parsed iTerm theme."""
     wm.iterm_palette.clear()
 
-    ansi = iterm_theme.get("ansi", [])
+    ansi = iterm_theme.ansi
 
     for slot_id, label in PALETTE_SLOTS:
         item = wm.iterm_palette.add()
@@ -192,7 +188,7 @@ def _populate_palette_from_iterm(wm, iterm_theme):
             else:
                 c = (0.5, 0.5, 0.5)
         else:
-            c = iterm_theme.get(slot_id)
+            c = getattr(iterm_theme, slot_id, None)
             if c is None:
                 # Use sensible defaults for missing extras
                 if slot_id == "bg":
@@ -213,38 +209,33 @@ def _populate_palette_from_iterm(wm, iterm_theme):
         item.orig_b = c[2]
 
     wm.iterm_palette_loaded = True
-    wm.iterm_palette_theme_name = iterm_theme.get("name", "Unknown")
+    wm.iterm_palette_theme_name = iterm_theme.name or "Unknown"
 
 
 def _build_iterm_theme_from_palette(wm):
-    """Reconstruct an iTerm theme dict from the editable palette."""
-    theme = {
-        "name": wm.iterm_palette_theme_name,
-        "ansi": [],
-    }
-
+    """Reconstruct an iTerm theme from the editable palette."""
     # Build a lookup
     palette_map = {}
     for item in wm.iterm_palette:
         palette_map[item.slot_id] = tuple(item.color)
 
     # ANSI 0-15
+    ansi = []
     for i in range(16):
         key = f"ansi_{i}"
-        theme["ansi"].append(palette_map.get(key, (0.5, 0.5, 0.5)))
-
-    # Named
-    theme["bg"] = palette_map.get("bg", theme["ansi"][0])
-    theme["fg"] = palette_map.get("fg", theme["ansi"][7])
-    theme["cursor"] = palette_map.get("cursor")
-    theme["selection"] = palette_map.get("selection")
-
-    # Set extras to None that we don't expose
-    theme["cursor_text"] = None
-    theme["selected_text"] = None
-    theme["bold"] = None
-
-    return theme
+        ansi.append(palette_map.get(key, (0.5, 0.5, 0.5)))
+
+    # Named; extras we don't expose (cursor_text, selected_text, bold) stay None
+    return iterm_parser.Theme(
+        name=wm.iterm_palette_theme_name,
+        path="",
+        source="custom",
+        ansi=ansi,
+        bg=palette_map.get("bg", ansi[0]),
+        fg=palette_map.get("fg", ansi[7]),
+        cursor=palette_map.get("cursor"),
+        selection=palette_map.get("selection"),
+    )
 
 
 # =========================================================================
@@ -487,7 +478,7 @@ class ITERM_OT_preview_swatches(Operator):
     bl_options = {'REGISTER'}
 
     def execute(self, context):
-        from . import iterm_parser, blender_theme_map
+        from . import iterm_parser, blender_theme_map, color_math
 
         wm = context.window_manager
         idx = wm.iterm_theme_active
@@ -505,10 +496,7 @@ class ITERM_OT_preview_swatches(Operator):
             print(f"  Dark theme: {palette['dark']}")
             print("  ANSI Colors:")
             for i, c in enumerate(palette['ansi']):
-                hexc = "#{:02x}{:02x}{:02x}".format(
-                    int(c[0]*255), int(c[1]*255), int(c[2]*255)
-                )
-                print(f"    [{i:2d}] {hexc}")
+                print(f"    [{i:2d}] {color_math.rgb_to_hex(c)}")
             print("  Derived palette:")
             print(summary)
             self.report({'INFO'}, f"Preview printed to console for: {theme_item.name}")
@@ -625,16 +613,11 @@ def _on_theme_sort_update(self, context):
 def _sort_themes(themes, sort_mode):
     """Sort theme list based on the selected mode."""
     if sort_mode == 'POPULAR':
-        from .popular import POPULAR_THEMES
-        def _pop_rank(name):
-            name_lower = name.lower()
-            for i, pop in enumerate(POPULAR_THEMES):
-                if pop in name_lower:
-                    return i
-            return len(POPULAR_THEMES)  # non-popular goes after all popular
+        from .popular import popular_rank
         # Popular themes ranked by their position in the curated list,
-        # non-popular themes alphabetically after
-        return sorted(themes, key=lambda t: (_pop_rank(t["name"]), t["name"].lower()))
+        # non-popular themes alphabetically after. Ranks are memoized, so
+        # re-sorting on every search keystroke doesn't rescan the list.
+        return sorted(themes, key=lambda t: (popular_rank(t["name"]), t["name"].lower()))
     elif sort_mode == 'AZ':
         return sorted(themes, key=lambda t: t["name"].lower())
     elif sort_mode == 'ZA':
@@ -643,8 +626,6 @@ def _sort_themes(themes, sort_mode):
 
 
 def register():
-    from . import prefs
-
     for cls in classes:
         bpy.utils.register_class(cls)
 
@@ -689,8 +670,6 @@ def register():
 
 
 def unregister():
-    from . import prefs
-
     del bpy.types.WindowManager.iterm_palette_swap_b
     del bpy.types.WindowManager.iterm_palette_swap_a
     del bpy.types.WindowManager.iterm_palette_theme_name
@@ -33,11 +33,11 @@ from . import color_math as cm
 
 
 def build_palette(iterm_theme):
-    ansi = iterm_theme["ansi"]
-    bg = iterm_theme["bg"]
-    fg = iterm_theme["fg"]
-    selection = iterm_theme.get("selection")
-    cursor = iterm_theme.get("cursor")
+    ansi = iterm_theme.ansi
+    bg = iterm_theme.bg
+    fg = iterm_theme.fg
+    selection = iterm_theme.selection
+    cursor = iterm_theme.cursor
 
     dark = cm.is_dark(bg)
 
@@ -130,9 +130,9 @@ def build_palette(iterm_theme):
     ui_panel_sub = bg                   # sub-panels: same as bg
 
     # Borders and separators: muted
-    ui_border = cm.ok_mix(fg, bg, 0.75)
-    ui_separator = cm.ok_mix(fg, bg, 0.82)
-    ui_panel_outline = cm.ok_mix(fg, bg, 0.80)
+    ui_border, ui_separator, ui_panel_outline = cm.ok_mix_many(
+        fg, (bg, bg, bg), (0.75, 0.82, 0.80)
+    )
 
     # Row alternation: subtle but visible stripe for outliner, spreadsheet
     if dark:
@@ -264,13 +264,13 @@ def build_palette(iterm_theme):
                 tgt_L = max(hL, 0.78)
             else:
                 tgt_L = max(hL * 0.65, 0.42)
-            tgt_C = min(hC * 1.1, cm.oklch_max_chroma(tgt_L, hH))
+            tgt_C = cm.oklch_clip_chroma(tgt_L, hC * 1.1, hH)
         else:
             if bright:
                 tgt_L = min(hL, 0.72)
             else:
                 tgt_L = min(hL * 0.75, 0.50)
-            tgt_C = min(hC * 0.95, cm.oklch_max_chroma(tgt_L, hH))
+            tgt_C = cm.oklch_clip_chroma(tgt_L, hC * 0.95, hH)
         tgt_C = max(tgt_C, 0.06)
         return cm.oklch_to_rgb(tgt_L, tgt_C, hH)
 
@@ -418,7 +418,7 @@ def build_palette(iterm_theme):
     # INPUT FIELDS — recessed (VS Code: slightly different from bg)
     # =====================================================================
     input_bg = recessed
-    input_border = cm.ok_mix(fg, bg, 0.70)
+    input_border = widget_outline       # same fg->bg mix, no need to redo it
 
     input_text = cm.ok_ensure_contrast(ui_text, input_bg, 5.0)
 
@@ -426,8 +426,7 @@ def build_palette(iterm_theme):
     # SCROLL — muted
     # =====================================================================
     scroll_bg = bg
-    scroll_handle = cm.ok_mix(fg, bg, 0.65)
-    scroll_handle_hover = cm.ok_mix(fg, bg, 0.50)
+    scroll_handle, scroll_handle_hover = cm.ok_mix_many(fg, (bg, bg), (0.65, 0.50))
 
     # =====================================================================
     # HEADER — same as bg (VS Code pattern: headers = bg)
@@ -489,11 +488,11 @@ def build_palette(iterm_theme):
     # Outliner active object tint: neutral/desaturated version.
     # In the 3D viewport obj_active is vivid (yellow/orange) for visibility,
     # but in the outliner it's a row tint behind text — needs to be muted.
-    if dark:
-        outliner_active_obj = cm.ok_mix(fg, bg, 0.45)  # neutral mid-gray
-    else:
-        outliner_active_obj = cm.ok_mix(fg, bg, 0.55)
-    wire_color = cm.ok_mix(fg, bg, 0.35)
+    # Both are fg->bg mixes, so convert fg and bg to OKLCH once;
+    # the outliner tint is a neutral mid-gray.
+    outliner_active_obj, wire_color = cm.ok_mix_many(
+        fg, (bg, bg), (0.45 if dark else 0.55, 0.35)
+    )
     wire_edit = cm.ok_mix(accent_primary, fg, 0.25)
 
     vertex_color = cm.ok_lighten(accent_bright, 0.07) if dark else accent_bright
@@ -561,11 +560,13 @@ def build_palette(iterm_theme):
     # NLA STRIPS — ANSI semantic colors mixed with card for context
     # =====================================================================
     _nla_mix_t = 0.40 if dark else 0.50
-    nla_strip = cm.ok_mix(accent_primary, medium_lift, _nla_mix_t)
-    nla_strip_selected = cm.ok_mix(accent_bright, medium_lift, _nla_mix_t - 0.10)
-    nla_transition = cm.ok_mix(accent_secondary, medium_lift, _nla_mix_t)
-    nla_meta = cm.ok_mix(magenta, medium_lift, _nla_mix_t)
-    nla_sound = cm.ok_mix(success, medium_lift, _nla_mix_t)
+    # ok_mix(a, b, t) == ok_mix(b, a, 1 - t): batch from the shared card color
+    _nla_keep = 1.0 - _nla_mix_t
+    nla_strip, nla_strip_selected, nla_transition, nla_meta, nla_sound = cm.ok_mix_many(
+        medium_lift,
+        (accent_primary, accent_bright, accent_secondary, magenta, success),
+        (_nla_keep, _nla_keep + 0.10, _nla_keep, _nla_keep, _nla_keep),
+    )
     nla_tweak = cm.ok_mix(danger, bg, 0.50)
     nla_tweak_dup = cm.ok_mix(danger_bright, bg, 0.40)
 
@@ -609,8 +610,7 @@ def build_palette(iterm_theme):
         iL, iC, iH = cm.rgb_to_oklch(*color)
         # Gentle chroma reduction for visual comfort
         target_C = iC * 0.75
-        max_c = cm.oklch_max_chroma(icon_L, iH)
-        return cm.oklch_to_rgb(icon_L, min(target_C, max_c), iH)
+        return cm.oklch_to_rgb(icon_L, cm.oklch_clip_chroma(icon_L, target_C, iH), iH)
 
     icon_scene = _icon_color(warning)
     icon_collection = _icon_color(cm.ok_desaturate(warning, 0.02))
@@ -626,7 +626,7 @@ def build_palette(iterm_theme):
     # =====================================================================
     palette = {
         "dark": dark,
-        "ansi": iterm_theme["ansi"],  # preserve originals
+        "ansi": iterm_theme.ansi,  # preserve originals
         # Surfaces
         "ui_bg": ui_bg,
         "ui_panel": ui_panel,
@@ -809,16 +809,8 @@ def palette_summary(palette):
             continue
         if isinstance(val, tuple):
             if len(val) == 3:
-                r, g, b = val
-                hexc = "#{:02x}{:02x}{:02x}".format(
-                    int(r * 255), int(g * 255), int(b * 255)
-                )
-                L, C, H = cm.rgb_to_oklch(r, g, b)
-                lines.append(f"  {key:25s} = {hexc}  L={L:.3f} C={C:.3f} H={H:.0f}")
+                L, C, H = cm.rgb_to_oklch(*val)
+                lines.append(f"  {key:25s} = {cm.rgb_to_hex(val)}  L={L:.3f} C={C:.3f} H={H:.0f}")
             elif len(val) == 4:
-                r, g, b, a = val
-                hexc = "#{:02x}{:02x}{:02x} a={:.2f}".format(
-                    int(r * 255), int(g * 255), int(b * 255), a
-                )
-                lines.append(f"  {key:25s} = {hexc}")
+                lines.append(f"  {key:25s} = {cm.rgb_to_hex(val)} a={val[3]:.2f}")
     return "\n".join(lines)
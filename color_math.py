@@ -25,13 +25,28 @@ WCAG contrast and luminance calculations use sRGB linear light.
 import colorsys
 import math
 
+_DEG_PER_RAD = 180.0 / math.pi
+_RAD_PER_DEG = math.pi / 180.0
+
 
 def clamp(v, lo=0.0, hi=1.0):
     return max(lo, min(hi, v))
 
 
 def clamp_rgb(rgb):
-    return tuple(clamp(c) for c in rgb)
+    return tuple([0.0 if c < 0.0 else (1.0 if c > 1.0 else c) for c in rgb])
+
+
+def rgb_to_hex(rgb):
+    """
+    Format the RGB part of a color as '#RRGGBB' (rounded, clamped).
+    This is the add-on's one hex formatter: the palette editor and the
+    console summaries both use it, so a color always prints the same.
+    """
+    return "#" + bytes([
+        0 if c <= 0.0 else (255 if c >= 1.0 else int(c * 255.0 + 0.5))
+        for c in rgb[:3]
+    ]).hex().upper()
 
 
 # =========================================================================
@@ -101,8 +116,8 @@ def rgb_to_oklch(r, g, b):
 
     L, a, b_val = _linear_rgb_to_oklab(lr, lg, lb)
 
-    C = math.sqrt(a * a + b_val * b_val)
-    H = math.degrees(math.atan2(b_val, a)) % 360.0
+    C = math.hypot(a, b_val)
+    H = (math.atan2(b_val, a) * _DEG_PER_RAD) % 360.0
 
     return (L, C, H)
 
@@ -112,7 +127,7 @@ def oklch_to_rgb(L, C, H):
     Convert OKLCH to sRGB (0-1), clamped to gamut.
     L is 0-1, C >= 0, H is 0-360 degrees.
     """
-    H_rad = math.radians(H)
+    H_rad = H * _RAD_PER_DEG
     a = C * math.cos(H_rad)
     b = C * math.sin(H_rad)
 
@@ -127,13 +142,13 @@ def oklch_to_rgb(L, C, H):
 
 def oklch_max_chroma(L, H, tolerance=0.001):
     """Find maximum in-gamut chroma for a given L and H in sRGB."""
+    H_rad = H * _RAD_PER_DEG
+    cos_h = math.cos(H_rad)
+    sin_h = math.sin(H_rad)
     lo, hi = 0.0, 0.4
     for _ in range(32):
         mid = (lo + hi) / 2.0
-        H_rad = math.radians(H)
-        a = mid * math.cos(H_rad)
-        b = mid * math.sin(H_rad)
-        lr, lg, lb = _oklab_to_linear_rgb(L, a, b)
+        lr, lg, lb = _oklab_to_linear_rgb(L, mid * cos_h, mid * sin_h)
         if lr >= -tolerance and lr <= 1.0 + tolerance and \
            lg >= -tolerance and lg <= 1.0 + tolerance and \
            lb >= -tolerance and lb <= 1.0 + tolerance:
@@ -143,6 +158,19 @@ def oklch_max_chroma(L, H, tolerance=0.001):
     return lo
 
 
+def oklch_clip_chroma(L, C, H):
+    """
+    Limit chroma C to the sRGB gamut at the given L and H.
+    Colors already inside the gamut are returned as-is after one direct
+    conversion; only out-of-gamut colors fall back to oklch_max_chroma().
+    """
+    H_rad = H * _RAD_PER_DEG
+    lr, lg, lb = _oklab_to_linear_rgb(L, C * math.cos(H_rad), C * math.sin(H_rad))
+    if 0.0 <= lr <= 1.0 and 0.0 <= lg <= 1.0 and 0.0 <= lb <= 1.0:
+        return C
+    return min(C, oklch_max_chroma(L, H))
+
+
 # =========================================================================
 # OKLCH-based color manipulation
 # =========================================================================
@@ -151,8 +179,7 @@ def ok_lighten(rgb, amount):
     """Lighten a color by shifting L in OKLCH. Perceptually uniform."""
     L, C, H = rgb_to_oklch(*rgb)
     L = clamp(L + amount)
-    max_c = oklch_max_chroma(L, H)
-    C = min(C, max_c)
+    C = oklch_clip_chroma(L, C, H)
     return oklch_to_rgb(L, C, H)
 
 
@@ -160,8 +187,7 @@ def ok_darken(rgb, amount):
     """Darken a color by shifting L in OKLCH. Perceptually uniform."""
     L, C, H = rgb_to_oklch(*rgb)
     L = clamp(L - amount)
-    max_c = oklch_max_chroma(L, H)
-    C = min(C, max_c)
+    C = oklch_clip_chroma(L, C, H)
     return oklch_to_rgb(L, C, H)
 
 
@@ -169,16 +195,14 @@ def ok_set_lightness(rgb, target_L):
     """Set OKLCH lightness to a specific value, preserving hue and chroma."""
     _, C, H = rgb_to_oklch(*rgb)
     L = clamp(target_L)
-    max_c = oklch_max_chroma(L, H)
-    C = min(C, max_c)
+    C = oklch_clip_chroma(L, C, H)
     return oklch_to_rgb(L, C, H)
 
 
 def ok_set_chroma(rgb, target_C):
     """Set OKLCH chroma to a specific value, preserving lightness and hue."""
     L, _, H = rgb_to_oklch(*rgb)
-    max_c = oklch_max_chroma(L, H)
-    C = min(clamp(target_C, 0.0, 0.4), max_c)
+    C = oklch_clip_chroma(L, clamp(target_C, 0.0, 0.4), H)
     return oklch_to_rgb(L, C, H)
 
 
@@ -193,8 +217,7 @@ def ok_saturate(rgb, amount):
     """Increase chroma by amount in OKLCH, gamut-clipped."""
     L, C, H = rgb_to_oklch(*rgb)
     C = C + amount
-    max_c = oklch_max_chroma(L, H)
-    C = min(C, max_c)
+    C = oklch_clip_chroma(L, C, H)
     return oklch_to_rgb(L, C, H)
 
 
@@ -203,8 +226,32 @@ def ok_mix(a, b, t):
     Mix two colors in Oklab space (perceptually linear blending).
     t=0 returns a, t=1 returns b.
     """
-    La, Ca, Ha = rgb_to_oklch(*a)
-    Lb, Cb, Hb = rgb_to_oklch(*b)
+    return _ok_mix_lch(rgb_to_oklch(*a), rgb_to_oklch(*b), t)
+
+
+def ok_mix_many(a, bs, ts):
+    """
+    Batched ok_mix(): mix a toward each bs[i] by ts[i].
+    a is converted to OKLCH once, and repeated b colors are converted
+    only once, so this is cheaper than calling ok_mix() in a loop.
+    Returns a list of RGB tuples.
+    """
+    lch_a = rgb_to_oklch(*a)
+    seen = {}
+    out = []
+    for b, t in zip(bs, ts):
+        key = tuple(b)
+        lch_b = seen.get(key)
+        if lch_b is None:
+            lch_b = seen[key] = rgb_to_oklch(*b)
+        out.append(_ok_mix_lch(lch_a, lch_b, t))
+    return out
+
+
+def _ok_mix_lch(lch_a, lch_b, t):
+    """Shared body of ok_mix()/ok_mix_many() on pre-converted OKLCH colors."""
+    La, Ca, Ha = lch_a
+    Lb, Cb, Hb = lch_b
 
     # Mix L and C linearly
     L = La * (1 - t) + Lb * t
@@ -227,8 +274,7 @@ def ok_mix(a, b, t):
     else:
         H = (Ha + diff * t) % 360
 
-    max_c = oklch_max_chroma(L, H)
-    C = min(C, max_c)
+    C = oklch_clip_chroma(L, C, H)
     return oklch_to_rgb(L, C, H)
 
 
@@ -247,13 +293,12 @@ def ok_ensure_contrast(fg, bg, min_ratio=4.5):
 
     for step in range(200):
         L = clamp(L + direction * 0.005)
-        max_c = oklch_max_chroma(L, H)
-        c = min(C, max_c)
+        c = oklch_clip_chroma(L, C, H)
         candidate = oklch_to_rgb(L, c, H)
         if contrast_ratio(candidate, bg) >= min_ratio:
             return candidate
 
-    return oklch_to_rgb(L, min(C, oklch_max_chroma(L, H)), H)
+    return oklch_to_rgb(L, oklch_clip_chroma(L, C, H), H)
 
 
 # =========================================================================
@@ -309,7 +354,14 @@ def generate_surface_ramp(bg, elevated, steps=10):
     # we keep bg's chroma as the floor and add a gentle boost.
     min_C = bg_C
 
-    ramp = []
+    # Hue delta along the shortest arc is the same for every stop
+    h_diff = el_H - bg_H
+    if h_diff > 180: h_diff -= 360
+    elif h_diff < -180: h_diff += 360
+    L_span = el_L - bg_L
+    C_span = el_C - bg_C
+
+    ramp = [None] * steps
     for i in range(steps):
         # Map ramp indices to interpolation parameter:
         # i=0: slightly below bg (recessed)   t ≈ -0.2
@@ -322,25 +374,21 @@ def generate_surface_ramp(bg, elevated, steps=10):
             t = (i - 1) / 4.0
 
         # Interpolate L
-        new_L = clamp(bg_L + (el_L - bg_L) * t, 0.01, 0.99)
+        new_L = clamp(bg_L + L_span * t, 0.01, 0.99)
 
         # Interpolate C with chroma floor
-        raw_C = bg_C + (el_C - bg_C) * t
+        raw_C = bg_C + C_span * t
         # Gentle chroma boost with elevation (professional systems do this)
         boost = 0.003 * max(0, t)
         new_C = max(min_C, raw_C) + boost
 
         # Interpolate H on shortest arc
-        h_diff = el_H - bg_H
-        if h_diff > 180: h_diff -= 360
-        elif h_diff < -180: h_diff += 360
         new_H = (bg_H + h_diff * t) % 360
 
         # Gamut clip
-        max_c = oklch_max_chroma(new_L, new_H)
-        new_C = min(new_C, max_c)
+        new_C = oklch_clip_chroma(new_L, new_C, new_H)
 
-        ramp.append(oklch_to_rgb(new_L, new_C, new_H))
+        ramp[i] = oklch_to_rgb(new_L, new_C, new_H)
 
     return ramp
 
@@ -361,12 +409,14 @@ def generate_categorical(n, target_L, target_C, start_H=30.0):
     Returns:
         List of n RGB tuples with maximally spaced hues.
     """
-    colors = []
+    if n <= 0:
+        return []
+    step = 360.0 / n
+    colors = [None] * n
     for i in range(n):
-        H = (start_H + i * (360.0 / n)) % 360.0
-        max_c = oklch_max_chroma(target_L, H)
-        C = min(target_C, max_c)
-        colors.append(oklch_to_rgb(target_L, C, H))
+        H = (start_H + i * step) % 360.0
+        C = oklch_clip_chroma(target_L, target_C, H)
+        colors[i] = oklch_to_rgb(target_L, C, H)
     return colors
 
 
@@ -22,7 +22,7 @@ Supported formats:
   - .yml (Gogh YAML)          — Gogh terminal themes
   - .yaml (base16 YAML)       — base16 schemes
 
-All parsers output the same normalized dict:
+All parsers output the same normalized Theme:
     name: str
     path: str
     source: str ("iterm", "gogh", "base16")
@@ -38,33 +38,78 @@ All parsers output the same normalized dict:
 
 import plistlib
 import os
+import re
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 
+# =========================================================================
+# Normalized theme
+# =========================================================================
+
+@dataclass(slots=True)
+class Theme:
+    """A parsed color scheme. Colors are RGB float tuples (0-1)."""
+    name: str
+    path: str
+    source: str
+    ansi: list
+    bg: tuple = None
+    fg: tuple = None
+    cursor: tuple = None
+    cursor_text: tuple = None
+    selection: tuple = None
+    selected_text: tuple = None
+    bold: tuple = None
+
+
 # =========================================================================
 # Hex helpers
 # =========================================================================
 
+# Byte value (0-255) -> float channel (0-1)
+_BYTE_TO_UNIT = tuple(i / 255.0 for i in range(256))
+
+
+@lru_cache(maxsize=4096)
 def _hex_to_rgb(hexstr):
-    """Convert '#RRGGBB' or 'RRGGBB' to (r, g, b) floats 0-1."""
+    """
+    Convert '#RRGGBB' or 'RRGGBB' to (r, g, b) floats 0-1.
+    The short '#RGB' and '#RRGGBBAA' forms are accepted too (alpha is dropped).
+    Memoized: the same few hundred hex strings recur across theme files.
+    """
     h = hexstr.strip().lstrip('#')
-    if len(h) == 6:
-        try:
-            return (
-                int(h[0:2], 16) / 255.0,
-                int(h[2:4], 16) / 255.0,
-                int(h[4:6], 16) / 255.0,
-            )
-        except ValueError:
-            return None
-    return None
+    if len(h) == 3:
+        h = h[0] * 2 + h[1] * 2 + h[2] * 2
+    elif len(h) == 8:
+        h = h[:6]
+    elif len(h) != 6:
+        return None
+    try:
+        b = bytes.fromhex(h)
+    except ValueError:
+        return None
+    if len(b) != 3:
+        return None
+    lut = _BYTE_TO_UNIT
+    return (lut[b[0]], lut[b[1]], lut[b[2]])
 
 
 # =========================================================================
 # iTerm (.itermcolors) parser
 # =========================================================================
 
-ANSI_KEYS = [f"Ansi {i} Color" for i in range(16)]
+ANSI_KEYS = tuple(f"Ansi {i} Color" for i in range(16))
+
+EXTRA_KEYS = (
+    ("cursor", "Cursor Color"),
+    ("cursor_text", "Cursor Text Color"),
+    ("selection", "Selection Color"),
+    ("selected_text", "Selected Text Color"),
+    ("bold", "Bold Color"),
+)
 
 
 def _extract_rgb(color_dict):
@@ -85,32 +130,39 @@ def parse_itermcolors(filepath):
     with open(filepath, "rb") as f:
         plist = plistlib.load(f)
 
-    theme = {
-        "name": filepath.stem,
-        "path": str(filepath),
-        "source": "iterm",
-        "ansi": [],
-    }
+    plist_get = plist.get
+    theme_ansi = []
 
+    # One lookup per key, clamp inlined (this runs 16x per file)
     for key in ANSI_KEYS:
-        if key in plist:
-            theme["ansi"].append(_extract_rgb(plist[key]))
-        else:
-            theme["ansi"].append(None)
-
-    _fill_missing_ansi(theme)
-
-    theme["bg"] = _extract_rgb(plist["Background Color"]) if "Background Color" in plist else theme["ansi"][0]
-    theme["fg"] = _extract_rgb(plist["Foreground Color"]) if "Foreground Color" in plist else theme["ansi"][7]
+        cd = plist_get(key)
+        if cd is None:
+            theme_ansi.append(None)
+            continue
+        cd_get = cd.get
+        theme_ansi.append((
+            min(1.0, max(0.0, float(cd_get("Red Component", 0.0)))),
+            min(1.0, max(0.0, float(cd_get("Green Component", 0.0)))),
+            min(1.0, max(0.0, float(cd_get("Blue Component", 0.0)))),
+        ))
+
+    _fill_missing_ansi(theme_ansi)
+
+    bg = plist_get("Background Color")
+    fg = plist_get("Foreground Color")
+    theme = Theme(
+        name=filepath.stem,
+        path=str(filepath),
+        source="iterm",
+        ansi=theme_ansi,
+        bg=_extract_rgb(bg) if bg is not None else theme_ansi[0],
+        fg=_extract_rgb(fg) if fg is not None else theme_ansi[7],
+    )
 
-    for extra, key in [
-        ("cursor", "Cursor Color"),
-        ("cursor_text", "Cursor Text Color"),
-        ("selection", "Selection Color"),
-        ("selected_text", "Selected Text Color"),
-        ("bold", "Bold Color"),
-    ]:
-        theme[extra] = _extract_rgb(plist[key]) if key in plist else None
+    for extra, key in EXTRA_KEYS:
+        cd = plist_get(key)
+        if cd is not None:
+            setattr(theme, extra, _extract_rgb(cd))
 
     return theme
 
@@ -119,6 +171,11 @@ def parse_itermcolors(filepath):
 # Gogh YAML parser
 # =========================================================================
 
+# One "key: value" line: (indent, key, raw value). Keys run up to the first
+# colon; lines that are blank, comments or have no colon never match.
+_YAML_LINE_RE = re.compile(r"^([ \t]*)(?![ \t#])([^:\n]*?)[ \t]*:([^\n]*)$", re.M)
+
+
 def _parse_yaml_simple(text):
     """
     Minimal YAML parser for flat or single-nested key-value files.
@@ -128,18 +185,12 @@ def _parse_yaml_simple(text):
     """
     result = {}
     in_section = None
-    for line in text.splitlines():
-        stripped = line.strip()
-        if not stripped or stripped.startswith('#') or stripped == '---':
-            continue
-        if ':' not in stripped:
-            continue
+    # The regex skips blank, comment and colon-less lines in C
+    for m in _YAML_LINE_RE.finditer(text):
+        indent_str, key, val = m.groups()
 
         # Check indentation — if indented, treat as nested under current section
-        indent = len(line) - len(line.lstrip())
-
-        key, _, val = stripped.partition(':')
-        key = key.strip()
+        indent = len(indent_str)
         val = val.strip()
 
         # Strip quotes
@@ -167,6 +218,12 @@ def _parse_yaml_simple(text):
     return result
 
 
+def _read_yaml(filepath):
+    """Read a YAML theme file into a flat mapping."""
+    with open(filepath, "r", encoding="utf-8", errors="replace") as f:
+        return _parse_yaml_simple(f.read())
+
+
 def parse_gogh_yaml(filepath):
     """
     Parse a Gogh YAML theme file.
@@ -179,45 +236,51 @@ def parse_gogh_yaml(filepath):
         cursor: cursor hex (optional)
     """
     filepath = Path(filepath)
-    with open(filepath, "r", encoding="utf-8", errors="replace") as f:
-        data = _parse_yaml_simple(f.read())
+    return _finish_gogh(filepath, _read_yaml(filepath))
 
-    theme_name = data.get("name", filepath.stem)
 
-    theme = {
-        "name": theme_name,
-        "path": str(filepath),
-        "source": "gogh",
-        "ansi": [],
-    }
+def _finish_gogh(filepath, data):
+    """Build a Gogh Theme from an already-parsed YAML mapping."""
+    theme_name = data.get("name", filepath.stem)
 
+    ansi = []
     for i in range(16):
         key = f"color_{i+1:02d}"
         hexval = data.get(key, "")
-        rgb = _hex_to_rgb(hexval)
-        theme["ansi"].append(rgb)
+        ansi.append(_hex_to_rgb(hexval))
 
-    _fill_missing_ansi(theme)
+    _fill_missing_ansi(ansi)
 
     bg_hex = data.get("background", "")
     fg_hex = data.get("foreground", "")
     cursor_hex = data.get("cursor", "")
 
-    theme["bg"] = _hex_to_rgb(bg_hex) or theme["ansi"][0]
-    theme["fg"] = _hex_to_rgb(fg_hex) or theme["ansi"][7]
-    theme["cursor"] = _hex_to_rgb(cursor_hex) if cursor_hex else None
-    theme["cursor_text"] = None
-    theme["selection"] = None
-    theme["selected_text"] = None
-    theme["bold"] = None
-
-    return theme
+    return Theme(
+        name=theme_name,
+        path=str(filepath),
+        source="gogh",
+        ansi=ansi,
+        bg=_hex_to_rgb(bg_hex) or ansi[0],
+        fg=_hex_to_rgb(fg_hex) or ansi[7],
+        cursor=_hex_to_rgb(cursor_hex) if cursor_hex else None,
+    )
 
 
 # =========================================================================
 # base16 YAML parser
 # =========================================================================
 
+_BASE16_KEYS = tuple(f"base{i:02X}" for i in range(16))
+
+# base16 slot feeding each ANSI color 0-15
+_BASE16_TO_ANSI = (
+    0x00, 0x08, 0x0B, 0x09,  #  0 Black, 1 Red, 2 Green, 3 Yellow
+    0x0D, 0x0E, 0x0C, 0x05,  #  4 Blue, 5 Magenta, 6 Cyan, 7 White
+    0x02, 0x08, 0x0B, 0x0A,  #  8 Bright Black, 9 Bright Red, 10 Bright Green, 11 Bright Yellow
+    0x0D, 0x0E, 0x0C, 0x07,  # 12 Bright Blue, 13 Bright Magenta, 14 Bright Cyan, 15 Bright White
+)
+
+
 def parse_base16_yaml(filepath):
     """
     Parse a base16 YAML scheme file.
@@ -233,82 +296,81 @@ def parse_base16_yaml(filepath):
         base07 = ANSI 15           base0F = brown
     """
     filepath = Path(filepath)
-    with open(filepath, "r", encoding="utf-8", errors="replace") as f:
-        data = _parse_yaml_simple(f.read())
+    return _finish_base16(filepath, _read_yaml(filepath))
+
 
+def _finish_base16(filepath, data):
+    """Build a base16 Theme from an already-parsed YAML mapping."""
     theme_name = data.get("scheme", data.get("name", filepath.stem))
 
-    bases = {}
-    for i in range(16):
-        key = f"base{i:02X}"
+    bases = []
+    for key in _BASE16_KEYS:
         hexval = data.get(key, "")
+        # Normalize to '#RRGGBB' so the memoized lookup shares entries with Gogh
         if hexval and not hexval.startswith('#'):
             hexval = '#' + hexval
-        bases[key] = _hex_to_rgb(hexval)
-
-    ansi = [
-        bases.get("base00"),  #  0 Black
-        bases.get("base08"),  #  1 Red
-        bases.get("base0B"),  #  2 Green
-        bases.get("base09"),  #  3 Yellow
-        bases.get("base0D"),  #  4 Blue
-        bases.get("base0E"),  #  5 Magenta
-        bases.get("base0C"),  #  6 Cyan
-        bases.get("base05"),  #  7 White
-        bases.get("base02"),  #  8 Bright Black
-        bases.get("base08"),  #  9 Bright Red
-        bases.get("base0B"),  # 10 Bright Green
-        bases.get("base0A"),  # 11 Bright Yellow
-        bases.get("base0D"),  # 12 Bright Blue
-        bases.get("base0E"),  # 13 Bright Magenta
-        bases.get("base0C"),  # 14 Bright Cyan
-        bases.get("base07"),  # 15 Bright White
-    ]
-
-    theme = {
-        "name": theme_name,
-        "path": str(filepath),
-        "source": "base16",
-        "ansi": ansi,
-    }
-    _fill_missing_ansi(theme)
-
-    theme["bg"] = bases.get("base00") or theme["ansi"][0]
-    theme["fg"] = bases.get("base05") or theme["ansi"][7]
-    theme["cursor"] = bases.get("base06")
-    theme["cursor_text"] = bases.get("base00")
-    theme["selection"] = bases.get("base02")
-    theme["selected_text"] = bases.get("base06")
-    theme["bold"] = None
-
-    return theme
+        bases.append(_hex_to_rgb(hexval))
+
+    ansi = [bases[i] for i in _BASE16_TO_ANSI]
+    _fill_missing_ansi(ansi)
+
+    return Theme(
+        name=theme_name,
+        path=str(filepath),
+        source="base16",
+        ansi=ansi,
+        bg=bases[0x00] or ansi[0],
+        fg=bases[0x05] or ansi[7],
+        cursor=bases[0x06],
+        cursor_text=bases[0x00],
+        selection=bases[0x02],
+        selected_text=bases[0x06],
+    )
 
 
 # =========================================================================
 # Unified parser — dispatch by file extension
 # =========================================================================
 
+# path -> ((st_mtime_ns, st_size), theme)
+_PARSE_CACHE = {}
+
+
 def parse_theme_file(filepath):
-    """Auto-detect format and parse any supported theme file."""
+    """
+    Auto-detect format and parse any supported theme file.
+
+    Results are cached per path and reused for as long as the file's
+    mtime and size are unchanged, so browsing back and forth through the
+    list does not re-read files. Treat the returned Theme as read-only.
+    """
     filepath = Path(filepath)
+    st = filepath.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = str(filepath)
+
+    cached = _PARSE_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    theme = _parse_theme_file_uncached(filepath)
+    _PARSE_CACHE[key] = (stamp, theme)
+    return theme
+
+
+def _parse_theme_file_uncached(filepath):
     ext = filepath.suffix.lower()
 
     if ext == ".itermcolors":
         return parse_itermcolors(filepath)
     elif ext in (".yml", ".yaml"):
-        with open(filepath, "r", encoding="utf-8", errors="replace") as f:
-            content = f.read(2000)
-        if "color_01:" in content or "color_02:" in content:
-            return parse_gogh_yaml(filepath)
-        elif "base00:" in content or "base00 :" in content:
-            return parse_base16_yaml(filepath)
-        elif "palette:" in content and ("base0" in content or "base1" in content):
-            return parse_base16_yaml(filepath)
-        else:
-            try:
-                return parse_gogh_yaml(filepath)
-            except Exception:
-                return parse_base16_yaml(filepath)
+        # Read and parse once, then pick the format from the keys present
+        data = _read_yaml(filepath)
+        if "color_01" in data or "color_02" in data:
+            return _finish_gogh(filepath, data)
+        if any(k.startswith("base0") for k in data):
+            return _finish_base16(filepath, data)
+        return _finish_gogh(filepath, data)
     else:
         raise ValueError(f"Unsupported file format: {ext}")
 
@@ -317,29 +379,32 @@ def parse_theme_file(filepath):
 # Defaults and scanning
 # =========================================================================
 
-def _fill_missing_ansi(theme):
-    """Fill missing ANSI colors with reasonable defaults."""
-    defaults = [
-        (0.0, 0.0, 0.0),       # 0  black
-        (0.8, 0.0, 0.0),       # 1  red
-        (0.0, 0.8, 0.0),       # 2  green
-        (0.8, 0.8, 0.0),       # 3  yellow
-        (0.0, 0.0, 0.8),       # 4  blue
-        (0.8, 0.0, 0.8),       # 5  magenta
-        (0.0, 0.8, 0.8),       # 6  cyan
-        (0.75, 0.75, 0.75),    # 7  white
-        (0.5, 0.5, 0.5),       # 8  bright black
-        (1.0, 0.0, 0.0),       # 9  bright red
-        (0.0, 1.0, 0.0),       # 10 bright green
-        (1.0, 1.0, 0.0),       # 11 bright yellow
-        (0.0, 0.0, 1.0),       # 12 bright blue
-        (1.0, 0.0, 1.0),       # 13 bright magenta
-        (0.0, 1.0, 1.0),       # 14 bright cyan
-        (1.0, 1.0, 1.0),       # 15 bright white
-    ]
+# Fallbacks for ANSI slots a theme file leaves undefined
+_ANSI_DEFAULTS = (
+    (0.0, 0.0, 0.0),       # 0  black
+    (0.8, 0.0, 0.0),       # 1  red
+    (0.0, 0.8, 0.0),       # 2  green
+    (0.8, 0.8, 0.0),       # 3  yellow
+    (0.0, 0.0, 0.8),       # 4  blue
+    (0.8, 0.0, 0.8),       # 5  magenta
+    (0.0, 0.8, 0.8),       # 6  cyan
+    (0.75, 0.75, 0.75),    # 7  white
+    (0.5, 0.5, 0.5),       # 8  bright black
+    (1.0, 0.0, 0.0),       # 9  bright red
+    (0.0, 1.0, 0.0),       # 10 bright green
+    (1.0, 1.0, 0.0),       # 11 bright yellow
+    (0.0, 0.0, 1.0),       # 12 bright blue
+    (1.0, 0.0, 1.0),       # 13 bright magenta
+    (0.0, 1.0, 1.0),       # 14 bright cyan
+    (1.0, 1.0, 1.0),       # 15 bright white
+)
+
+
+def _fill_missing_ansi(ansi):
+    """Fill missing entries of a 16-color ANSI list with reasonable defaults."""
     for i in range(16):
-        if theme["ansi"][i] is None:
-            theme["ansi"][i] = defaults[i]
+        if ansi[i] is None:
+            ansi[i] = _ANSI_DEFAULTS[i]
 
 
 SUPPORTED_EXTENSIONS = {".itermcolors", ".yml", ".yaml"}
@@ -347,32 +412,39 @@ SUPPORTED_EXTENSIONS = {".itermcolors", ".yml", ".yaml"}
 
 def scan_folder(folder_path):
     """
-    Scan a folder for supported theme files and return a list of
-    (name, filepath) tuples, sorted by name. Deduplicates by name.
+    Scan a folder (and up to two levels of subfolders) for supported theme
+    files and return a list of (name, filepath) tuples, sorted by name.
+    Deduplicates by name; when names collide, the file closest to the top
+    of the tree wins.
     """
-    folder = Path(folder_path)
-    themes = []
-    if not folder.is_dir():
-        return themes
+    if not os.path.isdir(folder_path):
+        return []
+
+    # Breadth-first walk. os.scandir hands back cached file-type info, so
+    # no extra stat() per entry and no Path objects for skipped files.
+    found = []
+    pending = deque([(str(Path(folder_path)), 0)])
+    while pending:
+        d, depth = pending.popleft()
+        try:
+            with os.scandir(d) as it:
+                for entry in it:
+                    if entry.is_file():
+                        name, dot, ext = entry.name.rpartition('.')
+                        if name and dot and '.' + ext.lower() in SUPPORTED_EXTENSIONS:
+                            found.append((name, entry.path, depth))
+                    elif depth < 2 and entry.is_dir():
+                        pending.append((entry.path, depth + 1))
+        except OSError:
+            continue
 
+    # One sort for both dedup order and output order
+    found.sort(key=lambda x: (x[0].lower(), x[2], x[1]))
+    themes = []
     seen_names = set()
-
-    def _scan_dir(d, depth=0):
-        if depth > 2:
-            return
-        try:
-            entries = sorted(d.iterdir(), key=lambda x: x.name.lower())
-        except PermissionError:
-            return
-        for f in entries:
-            if f.is_file() and f.suffix.lower() in SUPPORTED_EXTENSIONS:
-                name = f.stem
-                if name.lower() not in seen_names:
-                    themes.append((name, str(f)))
-                    seen_names.add(name.lower())
-            elif f.is_dir() and depth < 2:
-                _scan_dir(f, depth + 1)
-
-    _scan_dir(folder)
-    themes.sort(key=lambda x: x[0].lower())
+    for name, path, _ in found:
+        key = name.lower()
+        if key not in seen_names:
+            seen_names.add(key)
+            themes.append((name, path))
     return themes
@@ -25,6 +25,9 @@ only needs to CONTAIN one of these strings to be considered popular.
 Last updated: February 2025
 """
 
+import re
+from functools import lru_cache
+
 # Ordered roughly by community recognition / GitHub stars / usage.
 # Each entry is a lowercase substring that will be matched against theme names.
 POPULAR_THEMES = [
@@ -94,7 +97,35 @@ POPULAR_THEMES = [
 ]
 
 
+# All entries as one alternation, so a check is a single C-level scan
+# instead of one substring test per entry. Compiled on first use rather
+# than at import, since most sessions never sort by popularity.
+_POPULAR_RE = None
+
+
+def _popular_re():
+    global _POPULAR_RE
+    if _POPULAR_RE is None:
+        _POPULAR_RE = re.compile("|".join(re.escape(pop) for pop in POPULAR_THEMES))
+    return _POPULAR_RE
+
+
+@lru_cache(maxsize=2048)
 def is_popular(theme_name):
     """Check if a theme name matches any popular theme."""
+    return _popular_re().search(theme_name.lower()) is not None
+
+
+@lru_cache(maxsize=2048)
+def popular_rank(theme_name):
+    """
+    Position of the first POPULAR_THEMES entry contained in theme_name,
+    or len(POPULAR_THEMES) if none match (non-popular sorts last).
+    """
     name_lower = theme_name.lower()
-    return any(pop in name_lower for pop in POPULAR_THEMES)
+    if _popular_re().search(name_lower) is None:
+        return len(POPULAR_THEMES)
+    for i, pop in enumerate(POPULAR_THEMES):
+        if pop in name_lower:
+            return i
+    return len(POPULAR_THEMES)
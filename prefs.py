@@ -119,81 +119,17 @@ class ItermThemeImporterPrefs(bpy.types.AddonPreferences):
         # 1. THEME BROWSER
         # ==============================================================
         box = self._draw_section_header(layout, "show_browser", "Theme Browser", 'COLOR')
-
         if box is not None:
-            # Empty state — guide the user
-            if not wm.iterm_themes:
-                col = box.column(align=True)
-                col.scale_y = 1.0
-                col.label(text="No themes loaded yet.", icon='INFO')
-                col.label(text="Press the button below to get started.")
-                col.separator()
-
-            # Load button — first thing the user sees
-            box.operator("iterm_theme.refresh_repo", text="Load Themes", icon='IMPORT')
-
-            # Only show browser controls when themes are loaded
-            if wm.iterm_themes:
-                # Search + Sort on one row
-                row = box.row(align=True)
-                row.prop(wm, "iterm_theme_search", text="", icon='VIEWZOOM')
-                row.prop(wm, "iterm_theme_sort", text="")
-
-                # Theme list
-                box.template_list(
-                    "ITERM_UL_theme_list", "",
-                    wm, "iterm_themes",
-                    wm, "iterm_theme_active",
-                    rows=12,
-                )
-
-                box.label(text=f"{len(wm.iterm_themes)} themes available")
-
-                # Primary actions
-                row = box.row(align=True)
-                row.scale_y = 1.3
-                row.operator("iterm_theme.apply_theme", text="Apply", icon='CHECKMARK')
-                row.operator("preferences.reset_default_theme", text="Reset", icon='LOOP_BACK')
-
-                # Save reminder
-                box.separator()
-                note = box.row()
-                note.alignment = 'CENTER'
-                note.label(text="Save your preferences to keep the theme after restart.", icon='FILE_TICK')
+            self._draw_browser(box, wm)
 
         # ==============================================================
         # 1.1 PALETTE EDITOR
         # ==============================================================
         box = self._draw_section_header(layout, "show_palette_editor", "Palette Editor", 'BRUSHES_ALL')
-
         if box is not None:
+            # The per-slot editor rows are only built once a palette exists
             if wm.iterm_palette_loaded:
-                box.label(text=f"Editing: {wm.iterm_palette_theme_name}")
-                box.separator()
-
-                for i, item in enumerate(wm.iterm_palette):
-                    row = box.row(align=True)
-                    row.label(text=item.label)
-                    row.prop(item, "color", text="")
-                    row.prop(item, "hex_value", text="")
-
-                box.separator()
-
-                # Swap
-                sbox = box.box()
-                sbox.label(text="Swap Colors", icon='UV_SYNC_SELECT')
-                row = sbox.row(align=True)
-                row.prop(wm, "iterm_palette_swap_a", text="Slot A")
-                row.prop(wm, "iterm_palette_swap_b", text="Slot B")
-                sbox.operator("iterm_theme.swap_colors", text="Swap", icon='UV_SYNC_SELECT')
-
-                box.separator()
-
-                col = box.column(align=True)
-                col.scale_y = 1.3
-                col.operator("iterm_theme.apply_custom", text="Apply Custom Palette", icon='CHECKMARK')
-
-                box.operator("iterm_theme.reset_palette", text="Reset to Original", icon='LOOP_BACK')
+                self._draw_palette_editor(box, wm)
             else:
                 box.label(text="Select a theme and load its palette to edit.")
                 box.operator("iterm_theme.load_palette", text="Edit Colors", icon='BRUSHES_ALL')
@@ -202,22 +138,8 @@ class ItermThemeImporterPrefs(bpy.types.AddonPreferences):
         # 1.2 SETTINGS
         # ==============================================================
         box = self._draw_section_header(layout, "show_settings", "Settings", 'PREFERENCES')
-
         if box is not None:
-            # Preview
-            box.prop(self, "live_preview")
-
-            # Theme sources
-            box.separator()
-            box.label(text="Theme Sources:", icon='WORLD')
-            box.prop(self, "source_mode", text="")
-
-            if self.source_mode == 'REMOTE':
-                row = box.row(align=True)
-                row.prop(self, "source_iterm", toggle=True)
-                row.prop(self, "source_gogh", toggle=True)
-            else:
-                box.prop(self, "local_folder", text="")
+            self._draw_settings(box)
 
         # ==============================================================
         # ATTRIBUTION
@@ -230,10 +152,100 @@ class ItermThemeImporterPrefs(bpy.types.AddonPreferences):
                  " Themes are not made by NXSTYNATE"
         )
 
+    def _draw_browser(self, box, wm):
+        # Empty state — guide the user
+        if not wm.iterm_themes:
+            col = box.column(align=True)
+            col.scale_y = 1.0
+            col.label(text="No themes loaded yet.", icon='INFO')
+            col.label(text="Press the button below to get started.")
+            col.separator()
+
+        # Load button — first thing the user sees
+        box.operator("iterm_theme.refresh_repo", text="Load Themes", icon='IMPORT')
+
+        # Only show browser controls when themes are loaded
+        if not wm.iterm_themes:
+            return
+
+        # Search + Sort on one row
+        row = box.row(align=True)
+        row.prop(wm, "iterm_theme_search", text="", icon='VIEWZOOM')
+        row.prop(wm, "iterm_theme_sort", text="")
+
+        # Theme list
+        box.template_list(
+            "ITERM_UL_theme_list", "",
+            wm, "iterm_themes",
+            wm, "iterm_theme_active",
+            rows=12,
+        )
+
+        box.label(text=f"{len(wm.iterm_themes)} themes available")
+
+        # Primary actions
+        row = box.row(align=True)
+        row.scale_y = 1.3
+        row.operator("iterm_theme.apply_theme", text="Apply", icon='CHECKMARK')
+        row.operator("preferences.reset_default_theme", text="Reset", icon='LOOP_BACK')
+
+        # Save reminder
+        box.separator()
+        note = box.row()
+        note.alignment = 'CENTER'
+        note.label(text="Save your preferences to keep the theme after restart.", icon='FILE_TICK')
+
+    def _draw_palette_editor(self, box, wm):
+        box.label(text=f"Editing: {wm.iterm_palette_theme_name}")
+        box.separator()
+
+        for item in wm.iterm_palette:
+            row = box.row(align=True)
+            row.label(text=item.label)
+            row.prop(item, "color", text="")
+            row.prop(item, "hex_value", text="")
+
+        box.separator()
+
+        # Swap
+        sbox = box.box()
+        sbox.label(text="Swap Colors", icon='UV_SYNC_SELECT')
+        row = sbox.row(align=True)
+        row.prop(wm, "iterm_palette_swap_a", text="Slot A")
+        row.prop(wm, "iterm_palette_swap_b", text="Slot B")
+        sbox.operator("iterm_theme.swap_colors", text="Swap", icon='UV_SYNC_SELECT')
+
+        box.separator()
+
+        col = box.column(align=True)
+        col.scale_y = 1.3
+        col.operator("iterm_theme.apply_custom", text="Apply Custom Palette", icon='CHECKMARK')
+
+        box.operator("iterm_theme.reset_palette", text="Reset to Original", icon='LOOP_BACK')
+
+    def _draw_settings(self, box):
+        # Preview
+        box.prop(self, "live_preview")
+
+        # Theme sources
+        box.separator()
+        box.label(text="Theme Sources:", icon='WORLD')
+        box.prop(self, "source_mode", text="")
+
+        if self.source_mode == 'REMOTE':
+            row = box.row(align=True)
+            row.prop(self, "source_iterm", toggle=True)
+            row.prop(self, "source_gogh", toggle=True)
+        else:
+            box.prop(self, "local_folder", text="")
+
 
 def register():
-    bpy.utils.register_class(ItermThemeImporterPrefs)
+    # Idempotent: a script reload may call register() again before unregister()
+    if not ItermThemeImporterPrefs.is_registered:
+        bpy.utils.register_class(ItermThemeImporterPrefs)
 
 
 def unregister():
-    bpy.utils.unregister_class(ItermThemeImporterPrefs)
+    if ItermThemeImporterPrefs.is_registered:
+        bpy.utils.unregister_class(ItermThemeImporterPrefs)
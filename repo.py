@@ -27,12 +27,23 @@ subdirectories, then indexed together with deduplication.
 """
 
 import os
+import sys
 import json
 import time
+import shutil
+import tempfile
 import zipfile
-import io
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+# orjson is optional (Blender does not bundle it). When present it reads and
+# writes the index instead of the much slower stdlib json module.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # =========================================================================
 # Source definitions
@@ -54,11 +65,13 @@ SOURCES = {
 }
 
 
+@lru_cache(maxsize=1)
 def get_cache_dir():
     """Get the cache directory path. Creates it if needed.
 
     Uses Blender's extension_path_user which is the only approved
-    storage location for extensions platform add-ons.
+    storage location for extensions platform add-ons. The path is fixed
+    for the session, so it is resolved once and memoized.
     """
     import bpy
     try:
@@ -70,6 +83,7 @@ def get_cache_dir():
     return cache
 
 
+@lru_cache(maxsize=1)
 def get_index_path():
     """Get the index JSON file path."""
     return os.path.join(get_cache_dir(), "theme_index.json")
@@ -79,16 +93,34 @@ def load_index():
     """Load the theme index from disk."""
     index_path = get_index_path()
     if os.path.exists(index_path):
-        with open(index_path, "r") as f:
-            return json.load(f)
+        # One binary read() call; both parsers accept bytes and detect the
+        # UTF encoding themselves
+        with open(index_path, "rb") as f:
+            data = f.read()
+        index = orjson.loads(data) if orjson is not None else json.loads(data)
+        # json.load allocates a fresh string per value; share the handful of
+        # source keys and the names across every entry instead
+        intern = sys.intern
+        for t in index.get("themes", ()):
+            t["name"] = intern(t["name"])
+            t["source"] = intern(t["source"])
+        return index
     return {"themes": [], "last_updated": 0, "sources": []}
 
 
 def save_index(index_data):
     """Save the theme index to disk."""
     index_path = get_index_path()
-    with open(index_path, "w") as f:
-        json.dump(index_data, f, indent=2)
+    if orjson is not None:
+        data = orjson.dumps(index_data, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(index_data, indent=2).encode("utf-8")
+    # Write a sibling temp file and swap it in, so an interrupted save never
+    # leaves a truncated index behind
+    tmp_path = index_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, index_path)
 
 
 def index_local_folder(folder_path):
@@ -105,13 +137,34 @@ def index_local_folder(folder_path):
     return index
 
 
-def _download_and_extract(url, cache_subdir, extensions, repo_subdir=None, progress_callback=None):
+@lru_cache(maxsize=2)
+def _ssl_context(verify=True):
+    """
+    Shared SSL context. Building one loads and parses the CA bundle, so it
+    is done once per session rather than per download.
+    """
+    import ssl
+    if verify:
+        return ssl.create_default_context()
+    return ssl._create_unverified_context()
+
+
+def _download_and_extract(url, cache_subdir, extensions, repo_subdir=None,
+                          progress_callback=None, validators=None):
     """
     Download a zip from url, extract files matching extensions
     into cache_subdir. If repo_subdir is set, only extract files
     from paths containing that directory name.
-    Returns count of extracted files.
+
+    validators is an optional dict holding the "etag" / "last_modified"
+    of the previous download. When cache_subdir already has files they are
+    sent as a conditional GET, and the dict is updated from the response.
+
+    Returns the extracted themes as (name, filepath) tuples, deduplicated and
+    sorted like iterm_parser.scan_folder, or None if the server reports the
+    archive unchanged.
     """
+    import urllib.error
     import urllib.request
     import ssl
 
@@ -120,48 +173,99 @@ def _download_and_extract(url, cache_subdir, extensions, repo_subdir=None, progr
     if progress_callback:
         progress_callback(f"Downloading from {url[:60]}...")
 
-    try:
-        context = ssl.create_default_context()
-        req = urllib.request.Request(url, headers={
-            'User-Agent': 'Blender-iTerm-Theme-Importer/1.1'
-        })
-        response = urllib.request.urlopen(req, context=context, timeout=120)
-        data = response.read()
-    except ssl.SSLError:
-        context = ssl._create_unverified_context()
-        req = urllib.request.Request(url, headers={
-            'User-Agent': 'Blender-iTerm-Theme-Importer/1.1'
-        })
-        response = urllib.request.urlopen(req, context=context, timeout=120)
-        data = response.read()
+    headers = {'User-Agent': 'Blender-iTerm-Theme-Importer/1.1'}
+    if validators and os.listdir(cache_subdir):
+        if validators.get("etag"):
+            headers['If-None-Match'] = validators["etag"]
+        if validators.get("last_modified"):
+            headers['If-Modified-Since'] = validators["last_modified"]
+
+    suffixes = tuple(ext.lower() for ext in extensions)
+    if repo_subdir:
+        # Match the subdir as a whole path segment: nested or at the top level
+        subdir_needle = '/' + repo_subdir + '/'
+        subdir_prefix = repo_subdir + '/'
+
+    # Stream the archive to a spooled file (memory up to 8 MB, then disk)
+    # so peak memory stays bounded; ZipFile only needs a seekable file.
+    # The with block closes it on every path, including failed fetches.
+    with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024) as spool:
+        def fetch(context):
+            spool.seek(0)
+            spool.truncate()
+            req = urllib.request.Request(url, headers=headers)
+            with urllib.request.urlopen(req, context=context, timeout=120) as response:
+                shutil.copyfileobj(response, spool, 1024 * 1024)
+                return response.headers
 
-    if progress_callback:
-        progress_callback("Extracting themes...")
-
-    count = 0
-    with zipfile.ZipFile(io.BytesIO(data)) as zf:
-        for info in zf.infolist():
-            if info.is_dir():
-                continue
-            basename = os.path.basename(info.filename)
-            _, ext = os.path.splitext(basename)
-            if ext.lower() not in extensions:
-                continue
-            # Filter by subdir if specified (e.g. only files under "schemes/" or "base16/")
-            if repo_subdir:
-                # Check that the path contains the subdir segment
-                parts = info.filename.replace('\\', '/').split('/')
-                if repo_subdir not in parts:
+        try:
+            try:
+                response_headers = fetch(_ssl_context())
+            except ssl.SSLError:
+                response_headers = fetch(_ssl_context(verify=False))
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                if progress_callback:
+                    progress_callback("Not modified, keeping cached themes.")
+                return None
+            raise
+        spool.seek(0)
+
+        if validators is not None:
+            validators["etag"] = response_headers.get("ETag")
+            validators["last_modified"] = response_headers.get("Last-Modified")
+
+        if progress_callback:
+            progress_callback("Extracting themes...")
+
+        with zipfile.ZipFile(spool) as zf:
+            targets = {}
+            for info in zf.infolist():
+                # Most archive entries are not themes; reject them with one C-level
+                # suffix check (directory entries end in "/" and never match)
+                if not info.filename.lower().endswith(suffixes):
                     continue
-            # Skip config/template files
-            if basename.lower() in ('config.yaml', 'config.yml', '.yaml', '.yml'):
-                continue
-            target = os.path.join(cache_subdir, basename)
-            with zf.open(info) as src, open(target, 'wb') as dst:
-                dst.write(src.read())
-            count += 1
-
-    return count
+                basename = os.path.basename(info.filename)
+                # Filter by subdir if specified (e.g. only files under "schemes/" or "base16/")
+                if repo_subdir:
+                    filename = info.filename
+                    if subdir_needle not in filename and not filename.startswith(subdir_prefix):
+                        continue
+                # Skip config/template files
+                if basename.lower() in ('config.yaml', 'config.yml', '.yaml', '.yml'):
+                    continue
+                # Same basename twice: the later entry wins, as a serial extract
+                # would. Keyed case-insensitively because Foo.yml and foo.yml are
+                # one file on Windows/macOS, and two workers must never share it.
+                targets[basename.lower()] = (os.path.join(cache_subdir, basename), info)
+
+            def extract(item):
+                target, info = item
+                with zf.open(info) as src, open(target, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, 64 * 1024)
+
+            # Thousands of small files: overlap open/write/close latency and
+            # zlib inflate (which releases the GIL) across a few threads
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+                for _ in pool.map(extract, targets.values()):
+                    pass
+
+    # Same (name, filepath) list scan_folder would produce for cache_subdir,
+    # without walking it again
+    found = []
+    for target, _ in targets.values():
+        name = os.path.basename(target).rpartition('.')[0]
+        if name:
+            found.append((name, target))
+    found.sort(key=lambda x: (x[0].lower(), x[1]))
+    themes = []
+    seen_names = set()
+    for name, path in found:
+        key = name.lower()
+        if key not in seen_names:
+            seen_names.add(key)
+            themes.append((name, path))
+    return themes
 
 
 def download_repo(repo_url=None, progress_callback=None):
@@ -175,18 +279,48 @@ def download_repo(repo_url=None, progress_callback=None):
     cache_dir = get_cache_dir()
     schemes_dir = os.path.join(cache_dir, "schemes")
 
-    count = _download_and_extract(
+    themes = _download_and_extract(
         repo_url, schemes_dir, {".itermcolors"},
         repo_subdir="schemes",
         progress_callback=progress_callback,
     )
 
     if progress_callback:
-        progress_callback(f"Extracted {count} themes.")
+        progress_callback(f"Extracted {len(themes)} themes.")
 
     return index_local_folder(schemes_dir)
 
 
+def _download_source(source_key, source_dir, validators):
+    """
+    Download and extract one entry of SOURCES into source_dir.
+    validators is this source's conditional-GET state, updated in place.
+    Returns (ok, themes, messages): themes is the extracted (name, filepath)
+    list, or None when nothing was extracted; messages are the progress
+    lines to report.
+    """
+    src = SOURCES[source_key]
+    messages = [f"Downloading {src['name']}..."]
+    try:
+        themes = _download_and_extract(
+            src["url"], source_dir, src["extensions"],
+            repo_subdir=src.get("subdir"),
+            progress_callback=messages.append,
+            validators=validators,
+        )
+    except Exception as e:
+        # The extracted files may be incomplete; force a full download next time
+        validators.clear()
+        # Continue with other sources
+        messages.append(f"Warning: {src['name']} failed: {e}")
+        return False, None, messages
+    if themes is None:
+        messages.append(f"{src['name']}: up to date.")
+    else:
+        messages.append(f"{src['name']}: {len(themes)} themes extracted.")
+    return True, themes, messages
+
+
 def download_sources(enabled_sources, progress_callback=None):
     """
     Download multiple sources and build a unified, deduplicated index.
@@ -198,68 +332,74 @@ def download_sources(enabled_sources, progress_callback=None):
     Returns the combined index data dict.
     """
     cache_dir = get_cache_dir()
-    all_themes = []
-    seen_names = set()
     sources_done = []
 
-    for source_key in enabled_sources:
-        src = SOURCES.get(source_key)
-        if not src:
-            continue
-
-        source_dir = os.path.join(cache_dir, source_key)
-
-        try:
-            if progress_callback:
-                progress_callback(f"Downloading {src['name']}...")
-
-            count = _download_and_extract(
-                src["url"], source_dir, src["extensions"],
-                repo_subdir=src.get("subdir"),
-                progress_callback=progress_callback,
-            )
-
-            if progress_callback:
-                progress_callback(f"{src['name']}: {count} themes extracted.")
-
+    # Sources live on independent hosts, so fetch them concurrently. Progress
+    # messages are buffered per source and reported from this thread, since
+    # callbacks such as Operator.report are not thread-safe.
+    keys = [k for k in enabled_sources if k in SOURCES]
+    # ETag / Last-Modified per source from the previous run, for conditional GETs.
+    # An unreadable index must not block the refresh that rewrites it.
+    try:
+        http_cache = load_index().get("http_cache", {})
+    except (OSError, ValueError):
+        http_cache = {}
+    validators = {k: http_cache.setdefault(k, {}) for k in keys}
+    with ThreadPoolExecutor(max_workers=max(1, len(keys))) as pool:
+        results = list(pool.map(
+            lambda k: _download_source(k, os.path.join(cache_dir, k), validators[k]),
+            keys,
+        ))
+
+    extracted = {}
+    for source_key, (ok, themes, messages) in zip(keys, results):
+        if progress_callback:
+            for msg in messages:
+                progress_callback(msg)
+        if ok:
             sources_done.append(source_key)
+        if themes is not None:
+            extracted[source_key] = themes
 
-        except Exception as e:
-            if progress_callback:
-                progress_callback(f"Warning: {src['name']} failed: {e}")
-            # Continue with other sources
-            continue
-
-    # Now scan all source dirs and build unified index
+    # Build the unified index. Freshly extracted sources already know their
+    # files; only unchanged (304) or failed ones fall back to scanning the cache.
     from .iterm_parser import scan_folder
 
+    # Per source: lowercased name -> index entry
+    per_source = []
     for source_key in enabled_sources:
-        source_dir = os.path.join(cache_dir, source_key)
-        if not os.path.isdir(source_dir):
-            # Try legacy "schemes" dir for iterm
-            if source_key == "iterm":
-                source_dir = os.path.join(cache_dir, "schemes")
-                if not os.path.isdir(source_dir):
+        themes = extracted.get(source_key)
+        if themes is None:
+            source_dir = os.path.join(cache_dir, source_key)
+            if not os.path.isdir(source_dir):
+                # Try legacy "schemes" dir for iterm
+                if source_key == "iterm":
+                    source_dir = os.path.join(cache_dir, "schemes")
+                    if not os.path.isdir(source_dir):
+                        continue
+                else:
                     continue
-            else:
-                continue
+            themes = scan_folder(source_dir)
 
-        themes = scan_folder(source_dir)
-        for name, path in themes:
-            if name.lower() not in seen_names:
-                all_themes.append({
-                    "name": name,
-                    "path": path,
-                    "source": source_key,
-                })
-                seen_names.add(name.lower())
+        per_source.append({
+            name.lower(): {"name": name, "path": path, "source": source_key}
+            for name, path in themes
+        })
+
+    # The first enabled source to provide a name wins: merge in reverse
+    # priority so dict.update lets earlier sources overwrite later ones
+    themes_by_key = {}
+    for entries in reversed(per_source):
+        themes_by_key.update(entries)
 
-    all_themes.sort(key=lambda t: t["name"].lower())
+    # Keys are unique, so sorting them orders the entries by lowercased name
+    all_themes = [themes_by_key[key] for key in sorted(themes_by_key)]
 
     index = {
         "themes": all_themes,
         "last_updated": time.time(),
         "sources": sources_done,
+        "http_cache": http_cache,
     }
     save_index(index)
 
@@ -269,10 +409,32 @@ def download_sources(enabled_sources, progress_callback=None):
     return index
 
 
+# (mtime_ns, size) of the index file -> its theme list, so every search
+# keystroke does not re-read the JSON
+_THEME_LIST_CACHE = (None, [])
+
+
 def get_theme_list():
-    """Get the current list of themes from the index."""
-    index = load_index()
-    return index.get("themes", [])
+    """
+    Get the current list of themes from the index.
+
+    Each entry also carries "_name_lower" for search_themes. The list is
+    shared between calls until the index file changes; do not mutate it.
+    """
+    global _THEME_LIST_CACHE
+    try:
+        st = os.stat(get_index_path())
+        stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
+    if stamp is not None and _THEME_LIST_CACHE[0] == stamp:
+        return _THEME_LIST_CACHE[1]
+
+    themes = load_index().get("themes", [])
+    for t in themes:
+        t["_name_lower"] = t["name"].lower()
+    _THEME_LIST_CACHE = (stamp, themes)
+    return themes
 
 
 def search_themes(query, theme_list=None):
@@ -285,13 +447,18 @@ def search_themes(query, theme_list=None):
 
     results = []
     for t in theme_list:
-        name_lower = t["name"].lower()
+        name_lower = t.get("_name_lower") or t["name"].lower()
+        # Typical queries are plain substrings ("solar", "gruv"); one C scan
+        if q in name_lower:
+            results.append(t)
+            continue
         # Fuzzy: each char in query must appear in order
-        qi = 0
-        for ch in name_lower:
-            if qi < len(q) and ch == q[qi]:
-                qi += 1
-        if qi == len(q):
+        pos = -1
+        for ch in q:
+            pos = name_lower.find(ch, pos + 1)
+            if pos < 0:
+                break
+        else:
             results.append(t)
 
     return results